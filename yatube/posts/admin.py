@@ -2,6 +2,8 @@ from django.contrib import admin
 
 from .models import Comment, Group, Post
 
+EMPTY_VALUE_DISPLAY = '-пусто-'
+
 
 class PostAdmin(admin.ModelAdmin):
     list_display = (
@@ -14,20 +16,37 @@ class PostAdmin(admin.ModelAdmin):
     list_editable = ('group',)
     search_fields = ('text',)
     list_filter = ('pub_date',)
-    empty_value_display = '-пусто-'
+    list_select_related = ('author', 'group')
+    raw_id_fields = ('author',)
+    empty_value_display = EMPTY_VALUE_DISPLAY
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_foreignkey(
+            db_field, request, **kwargs)
+        if db_field.name == 'group':
+            # list_editable строит форму на каждую строку списка,
+            # поэтому группы выбираем один раз за запрос
+            choices = getattr(request, '_group_choices', None)
+            if choices is None:
+                choices = list(formfield.choices)
+                request._group_choices = choices
+            formfield.choices = choices
+        return formfield
 
 
 class GroupAdmin(admin.ModelAdmin):
     list_display = ('title', 'slug', 'description')
-    search_field = ('title')
-    empty_value_display = '-пусто-'
+    search_fields = ('title',)
+    empty_value_display = EMPTY_VALUE_DISPLAY
 
 
 class CommentAdmin(admin.ModelAdmin):
     list_display = ('text', 'author', 'created', 'post')
-    search_field = ('text', 'created')
+    search_fields = ('text',)
     list_filter = ('author', 'created')
-    empty_value_display = '-пусто-'
+    list_select_related = ('author', 'post')
+    raw_id_fields = ('author', 'post')
+    empty_value_display = EMPTY_VALUE_DISPLAY
 
 
 admin.site.register(Post, PostAdmin)
@@ -0,0 +1,8 @@
+import atexit
+import shutil
+import tempfile
+
+# Общая для всех тестов posts папка с загрузками во временном каталоге
+# системы (TMPDIR), а не в дереве проекта
+TEMP_MEDIA_ROOT = tempfile.mkdtemp(prefix='yatube-media-')
+atexit.register(shutil.rmtree, TEMP_MEDIA_ROOT, ignore_errors=True)
@@ -1,26 +1,21 @@
-import shutil
-import tempfile
 from http import HTTPStatus
 
-from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
-from ..forms import PostForm
 from ..models import Comment, Group, Post
+from . import TEMP_MEDIA_ROOT
+from ._fixtures import SMALL_GIF
 
 User = get_user_model()
 
-TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
-
 
 @override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
 class PostFormTests(TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.group = Group.objects.create(
             title='Тестовый заголовок',
             description='Тестовый текст',
@@ -32,36 +27,18 @@ class PostFormTests(TestCase):
             group=cls.group,
             text='text'
         )
-        cls.form = PostForm()
-        small_gif = (b'\x47\x49\x46\x38\x39\x61\x02\x00'
-                     b'\x01\x00\x80\x00\x00\x00\x00\x00'
-                     b'\xFF\xFF\xFF\x21\xF9\x04\x00\x00'
-                     b'\x00\x00\x00\x2C\x00\x00\x00\x00'
-                     b'\x02\x00\x01\x00\x00\x02\x02\x0C'
-                     b'\x0A\x00\x3B')
         cls.uploaded = SimpleUploadedFile(
             name='small.gif',
-            content=small_gif,
-            content_type='image/gif'
-        )
-        cls.uploaded2 = SimpleUploadedFile(
-            name='small2.gif',
-            content=small_gif,
+            content=SMALL_GIF,
             content_type='image/gif'
         )
-
-    @classmethod
-    def tearDownClass(cls):
-        super().tearDownClass()
-        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
-
-    def setUp(self):
-        self.unauthorized_client = Client()
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
+        cls.unauthorized_client = Client()
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
 
     def test_create_post_with_image(self):
         posts_count = Post.objects.count()
+        self.uploaded.seek(0)
         form_data = {
             'text': self.post.text,
             'group': self.group.id,
@@ -77,7 +54,7 @@ class PostFormTests(TestCase):
                 'username': PostFormTests.user.username}),
             HTTPStatus.FOUND)
         self.assertEqual(Post.objects.count(), posts_count + 1)
-        post = Post.objects.first()
+        post = Post.objects.exclude(pk=self.post.pk).get()
         self.assertEqual(post.text, self.post.text)
         self.assertEqual(post.author, self.post.author)
         self.assertEqual(post.group, self.post.group)
@@ -104,7 +81,11 @@ class PostFormTests(TestCase):
         form_data = {
             'text': self.post.text,
             'group': self.group.id,
-            'image': self.uploaded2,
+            'image': SimpleUploadedFile(
+                name='small2.gif',
+                content=SMALL_GIF,
+                content_type='image/gif'
+            ),
         }
         response = self.authorized_client.post(
             reverse('posts:post_edit', kwargs={'post_id': self.post.pk}),
@@ -116,7 +97,7 @@ class PostFormTests(TestCase):
             reverse(
                 'posts:post_detail',
                 kwargs={'post_id': self.post.pk}), HTTPStatus.FOUND)
-        post = Post.objects.first()
+        post = Post.objects.get(pk=self.post.pk)
         self.assertEqual(post.text, self.post.text)
         self.assertEqual(post.author, self.post.author)
         self.assertEqual(post.group, self.post.group)
@@ -131,9 +112,9 @@ class PostFormTests(TestCase):
         self.assertRedirects(response, reverse(
             'posts:post_detail', kwargs={'post_id': self.post.pk}))
         self.assertEqual(Comment.objects.count(), count + 1)
-        self.assertTrue(Comment.objects.filter(post=self.post.pk,
-                                               author=self.user,
-                                               text=self.post.text))
+        self.assertTrue(Comment.objects.filter(
+            post=self.post.pk, author=self.user, text=self.post.text
+        ).exists())
 
     def test_cannot_create_comment_by_unauth(self):
         count = Comment.objects.count()
@@ -1,16 +1,15 @@
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.test import Client, TestCase
 
 from ..models import Group, Post
+from .utils import drop_index_cache
 
 User = get_user_model()
 
 
 class URLTests(TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create_user(username='auth')
         cls.group = Group.objects.create(
             title='Тестовая группа',
@@ -43,12 +42,12 @@ class URLTests(TestCase):
             f'/profile/{cls.user.username}/follow/': 'posts/profile.html',
             f'/profile/{cls.user.username}/unfollow/': 'posts/profile.html',
         }
+        cls.guest_client = Client()
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
 
     def setUp(self):
-        self.guest_client = Client()
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
-        cache.clear()
+        drop_index_cache(self.guest_client, self.authorized_client)
 
     def test_urls_public_pages(self):
         """Проверяем доступность страниц неавторизованному пользователю"""
@@ -1,26 +1,21 @@
-import shutil
-import tempfile
-
 from django import forms
-from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
 from ..models import Follow, Group, Post
+from . import TEMP_MEDIA_ROOT
+from ._fixtures import SMALL_GIF
+from .utils import drop_index_cache
 
 User = get_user_model()
 
-TEMP_MEDIA_ROOT = tempfile.mkdtemp(dir=settings.BASE_DIR)
-
 
 @override_settings(MEDIA_ROOT=TEMP_MEDIA_ROOT)
 class PostsPagesTests(TestCase):
     @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
+    def setUpTestData(cls):
         cls.user = User.objects.create(username='auth')
         cls.user2 = User.objects.create(username='follower')
         cls.group = Group.objects.create(
@@ -35,89 +30,84 @@ class PostsPagesTests(TestCase):
         )
 
         paginator_posts = 13
-        for posts in range(paginator_posts):
-            Post.objects.create(
+        Post.objects.bulk_create([
+            Post(
                 author=cls.user,
                 text='Тестовый текст',
                 group=cls.group,)
-
+            for _ in range(paginator_posts)
+        ])
+
+        cls.url_index = reverse('posts:index')
+        cls.url_group = reverse(
+            'posts:group_posts', kwargs={'slug': cls.group.slug})
+        cls.url_profile = reverse(
+            'posts:profile', kwargs={'username': cls.user.username})
+        cls.url_detail = reverse(
+            'posts:post_detail', kwargs={'post_id': cls.post.pk})
+        cls.url_create = reverse('posts:post_create')
+        cls.url_edit = reverse(
+            'posts:post_edit', kwargs={'post_id': cls.post.pk})
+        cls.url_follow_index = reverse('posts:follow_index')
+        cls.url_follow = reverse(
+            'posts:profile_follow', kwargs={'username': cls.user.username})
+        cls.url_unfollow = reverse(
+            'posts:profile_unfollow', kwargs={'username': cls.user.username})
         cls.urls_with_paginator = (
-            reverse('posts:index'),
-            reverse('posts:group_posts', kwargs={'slug': 'test_slug'}),
-            reverse('posts:profile', kwargs={
-                'username': PostsPagesTests.user.username}),
-        )
-        small_gif = (b'\x47\x49\x46\x38\x39\x61\x02\x00'
-                     b'\x01\x00\x80\x00\x00\x00\x00\x00'
-                     b'\xFF\xFF\xFF\x21\xF9\x04\x00\x00'
-                     b'\x00\x00\x00\x2C\x00\x00\x00\x00'
-                     b'\x02\x00\x01\x00\x00\x02\x02\x0C'
-                     b'\x0A\x00\x3B')
-        cls.uploaded = SimpleUploadedFile(
-            name='small2.gif',
-            content=small_gif,
-            content_type='image/gif'
+            cls.url_index,
+            cls.url_group,
+            cls.url_profile,
         )
-
-    @classmethod
-    def tearDownClass(cls):
-        super().tearDownClass()
-        shutil.rmtree(TEMP_MEDIA_ROOT, ignore_errors=True)
+        cls.authorized_client = Client()
+        cls.authorized_client.force_login(cls.user)
+        cls.authorized_client2 = Client()
+        cls.authorized_client2.force_login(cls.user2)
 
     def setUp(self):
-        self.authorized_client = Client()
-        self.authorized_client.force_login(self.user)
-        self.authorized_client2 = Client()
-        self.authorized_client2.force_login(self.user2)
-        cache.clear()
+        drop_index_cache(self.authorized_client, self.authorized_client2)
 
     def test_pages_uses_correct_template(self):
-        urls_templates = {
-            reverse('about:author'): 'about/author.html',
-            reverse('about:tech'): 'about/tech.html',
-            reverse('posts:index'): 'posts/index.html',
-            reverse('posts:group_posts', kwargs={'slug': 'test_slug'}):
-                'posts/group_list.html',
-            reverse('posts:profile', kwargs={'username': 'auth'}):
-                'posts/profile.html',
-            reverse('posts:post_detail', kwargs={'post_id': self.post.pk}):
-                'posts/post_detail.html',
-            reverse('posts:post_create'): 'posts/post_create.html',
-            reverse('posts:post_edit', kwargs={'post_id': self.post.pk}):
-                'posts/post_create.html'
-        }
-        for reverse_name, template in urls_templates.items():
+        # число запросов к БД фиксирует отсутствие N+1 на страницах
+        urls_templates = (
+            (reverse('about:author'), 'about/author.html', 2),
+            (reverse('about:tech'), 'about/tech.html', 2),
+            (self.url_index, 'posts/index.html', 4),
+            (self.url_group, 'posts/group_list.html', 5),
+            (self.url_profile, 'posts/profile.html', 6),
+            (self.url_detail, 'posts/post_detail.html', 5),
+            (self.url_create, 'posts/post_create.html', 3),
+            (self.url_edit, 'posts/post_create.html', 4),
+        )
+        for reverse_name, template, queries in urls_templates:
             with self.subTest(reverse_name=reverse_name):
-                response = self.authorized_client.get(reverse_name)
+                with self.assertNumQueries(queries):
+                    response = self.authorized_client.get(reverse_name)
                 self.assertTemplateUsed(response, template)
 
     def test_index_show_correct_context(self):
-        response = self.authorized_client.get(reverse('posts:index'))
+        response = self.authorized_client.get(self.url_index)
         post = response.context['page_obj'][0]
         self.assertEqual(post.text, self.post.text)
         self.assertEqual(post.author, self.post.author)
         self.assertEqual(post.group, self.post.group)
 
     def test_group_posts_show_correct_context(self):
-        response = self.authorized_client.get(
-            reverse('posts:group_posts', kwargs={'slug': 'test_slug'}))
+        response = self.authorized_client.get(self.url_group)
         post = response.context['page_obj'][0]
         self.assertEqual(post.group, self.post.group)
 
     def test_profile_show_correct_context(self):
-        response = self.authorized_client.get(reverse(
-            'posts:profile', kwargs={'username': 'auth'}))
+        response = self.authorized_client.get(self.url_profile)
         post = response.context['page_obj'][0]
         self.assertEqual(post.author, self.post.author)
 
     def test_post_detail_correct_context(self):
-        response = self.authorized_client.get(reverse(
-            'posts:post_detail', kwargs={'post_id': self.post.pk}))
+        response = self.authorized_client.get(self.url_detail)
         post = response.context['post'].pk
         self.assertEqual(post, self.post.pk)
 
     def test_post_create_correct_context(self):
-        response = self.authorized_client.get(reverse('posts:post_create'))
+        response = self.authorized_client.get(self.url_create)
         form_fields = {'text': forms.fields.CharField,
                        'group': forms.fields.ChoiceField}
         for value, expected in form_fields.items():
@@ -126,8 +116,7 @@ class PostsPagesTests(TestCase):
                 self.assertIsInstance(field, expected)
 
     def test_post_edit_correct_context(self):
-        response = self.authorized_client.get(reverse(
-            'posts:post_edit', kwargs={'post_id': self.post.pk}))
+        response = self.authorized_client.get(self.url_edit)
         form_fields = {'text': forms.fields.CharField,
                        'group': forms.fields.ChoiceField}
         for value, expected in form_fields.items():
@@ -145,7 +134,11 @@ class PostsPagesTests(TestCase):
             author=self.user,
             text='Тестовый текст',
             group=self.group,
-            image=self.uploaded
+            image=SimpleUploadedFile(
+                name='small2.gif',
+                content=SMALL_GIF,
+                content_type='image/gif'
+            )
         )
         for url in self.urls_with_paginator:
             with self.subTest(url=url):
@@ -157,44 +150,38 @@ class PostsPagesTests(TestCase):
                 self.assertEqual(first_object.image, post.image)
 
     def test_cache(self):
-        response = self.authorized_client.get(reverse('posts:index')).content
+        response = self.authorized_client.get(self.url_index).content
         Post.objects.create(
             author=self.user,
             text='Тестовый текст',
         )
-        self.assertEqual(response, self.authorized_client.get(
-            reverse('posts:index')).content)
-        cache.clear()
-        self.assertNotEqual(response, self.authorized_client.get(
-            reverse('posts:index')).content)
+        self.assertEqual(
+            response, self.authorized_client.get(self.url_index).content)
+        drop_index_cache(self.authorized_client)
+        self.assertNotEqual(
+            response, self.authorized_client.get(self.url_index).content)
 
     def test_follower_can_get_post(self):
         Follow.objects.create(author=self.user, user=self.user2)
-        Post.objects.create(author=self.user, text='Тестовый текст')
-        response = self.authorized_client2.get(reverse('posts:follow_index'))
+        new_post = Post.objects.create(author=self.user, text='Тестовый текст')
+        response = self.authorized_client2.get(self.url_follow_index)
         first_object = response.context['page_obj'][0]
-        self.assertEqual(first_object, Post.objects.first())
+        self.assertEqual(first_object, new_post)
 
     def test_unfollower_cant_get_post(self):
-        content1 = self.authorized_client.get(
-            reverse('posts:follow_index')).content
-        Post.objects.create(author=self.user2, text='Тестовый текст')
-        content2 = self.authorized_client.get(
-            reverse('posts:follow_index')).content
-        self.assertEqual(content1, content2)
+        post = Post.objects.create(author=self.user2, text='Тестовый текст')
+        response = self.authorized_client.get(self.url_follow_index)
+        self.assertNotIn(post, response.context['page_obj'])
 
     def test_follow(self):
         follow_count = Follow.objects.count()
-        self.authorized_client2.get(reverse(
-            'posts:profile_follow',
-            kwargs={'username': self.user}), follow=True)
+        self.authorized_client2.get(self.url_follow, follow=True)
         self.assertEqual(follow_count + 1, Follow.objects.count())
         self.assertTrue(Follow.objects.filter(
-            user=self.user2, author=self.user))
+            user=self.user2, author=self.user).exists())
 
     def test_unfollow(self):
         Follow.objects.create(author=self.user, user=self.user2)
         follow_count = Follow.objects.count()
-        self.authorized_client2.get(reverse(
-            'posts:profile_unfollow', kwargs={'username': self.user.username}))
+        self.authorized_client2.get(self.url_unfollow)
         self.assertEqual(follow_count - 1, Follow.objects.count())
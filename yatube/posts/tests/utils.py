@@ -0,0 +1,14 @@
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils.cache import get_cache_key
+
+
+def drop_index_cache(*clients):
+    """Удаляет закешированную главную только для переданных клиентов."""
+    factory = RequestFactory()
+    for client in clients:
+        factory.cookies = client.cookies
+        key = get_cache_key(factory.get(reverse('posts:index')))
+        if key is not None:
+            cache.delete(key)
@@ -7,16 +7,30 @@ from django.views.decorators.cache import cache_page
 from .forms import CommentForm, PostForm
 from .models import Follow, Group, Post, User
 
+# Поля, которые выводят ленты постов: из автора и группы
+# не тянем лишние колонки (пароль, email, описание группы)
+POST_LIST_FIELDS = (
+    'text', 'pub_date', 'image',
+    'author__username', 'author__first_name', 'author__last_name',
+    'group__slug',
+)
+
 
 def paginator(request, posts):
     pages = Paginator(posts, settings.MY_CONSTANTA)
     page_number = request.GET.get('page')
-    return pages.get_page(page_number)
+    page_obj = pages.get_page(page_number)
+    # OFFSET/LIMIT отрабатывают на узкой выборке одних pk,
+    # полные строки забираем только для постов текущей страницы
+    page_obj.object_list = posts.filter(
+        pk__in=page_obj.object_list.values('pk'))
+    return page_obj
 
 
 @cache_page(20)
 def index(request):
-    posts = Post.objects.all()
+    posts = Post.objects.select_related(
+        'author', 'group').only(*POST_LIST_FIELDS)
     page_obj = paginator(request, posts)
     context = {
         'page_obj': page_obj,
@@ -26,7 +40,7 @@ def index(request):
 
 def group_posts(request, slug):
     group = get_object_or_404(Group, slug=slug)
-    posts = group.posts.all()
+    posts = group.posts.select_related('author').only(*POST_LIST_FIELDS)
     page_obj = paginator(request, posts)
     context = {
         'group': group,
@@ -37,7 +51,7 @@ def group_posts(request, slug):
 
 def profile(request, username):
     author = get_object_or_404(User, username=username)
-    posts = author.posts.all()
+    posts = author.posts.select_related('group').only(*POST_LIST_FIELDS)
     page_obj = paginator(request, posts)
     user = request.user
     following = user.is_authenticated and author.following.exists()
@@ -50,9 +64,10 @@ def profile(request, username):
 
 
 def post_detail(request, post_id):
-    post = get_object_or_404(Post, pk=post_id)
+    post = get_object_or_404(
+        Post.objects.select_related('author', 'group'), pk=post_id)
     form = CommentForm(request.POST or None)
-    comments = post.comments.all()
+    comments = post.comments.select_related('author')
     context = {
         'post': post,
         'comments': comments,
@@ -77,7 +92,7 @@ def post_create(request):
 
 def post_edit(request, post_id):
     post = get_object_or_404(Post, pk=post_id)
-    if post.author != request.user:
+    if post.author_id != request.user.id:
         return redirect('posts:post_detail', post_id=post_id)
 
     form = PostForm(
@@ -112,11 +127,12 @@ def add_comment(request, post_id):
 
 @login_required
 def follow_index(request):
-    # информация о текущем пользователе доступна в переменной request.user
-    # ...
-    user = request.user
-    authors = user.follower.values_list('author', flat=True)
-    posts = Post.objects.filter(author__id__in=authors)
+    # подписки не вычитываем отдельно: ленивый values() уходит
+    # в один запрос подзапросом author_id IN (SELECT ...)
+    authors = request.user.follower.values('author_id')
+    posts = Post.objects.filter(
+        author_id__in=authors).select_related(
+            'author', 'group').only(*POST_LIST_FIELDS)
     page_obj = paginator(request, posts)
     context = {'page_obj': page_obj}
     return render(request, 'posts/follow.html', context)
@@ -0,0 +1,19 @@
+"""
+Settings for running the test suite.
+
+Usage: python3 manage.py test --settings=yatube.test_settings --parallel
+"""
+
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# В тестах надёжность хеша не нужна, а PBKDF2 заметно тормозит create_user
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]